@@ -15,7 +15,7 @@ Description:
     5. TEMPERATURE: Uses a multi-stage probe (WMI, PerfCounters, OHM) to find thermal data.
 
     Architecture:
-    - Threading: Network calls (Ping) run in background threads to prevent GUI freezing.
+    - Threading: Network calls (Ping) and psutil sampling run in background threads to prevent GUI freezing.
     - CustomTkinter: Provides the modern, High-DPI, Dark-Mode interface.
     - Registry/WMI: Used for hardware scraping without requiring Administrator privileges.
 """
@@ -26,7 +26,9 @@ Description:
 import customtkinter as ctk  # UI Framework for modern, rounded, dark-themed widgets
 import psutil                # The core engine for fetching CPU/RAM/Disk usage stats
 import threading             # Allows running blocking tasks (like Ping) in the background
-import socket                # Used for raw TCP connections to measure network latency
+import socket                # Used for raw UDP DNS queries to measure network latency
+import struct                # Packs the DNS query header for the ping probe
+import random                # Random DNS query IDs
 import platform              # Retrieves basic OS and Hostname information
 import time                  # Used for timing loops and delays
 import subprocess            # Executes Windows Shell commands (PowerShell/WMIC)
@@ -34,9 +36,16 @@ import sys                   # System parameters
 import ctypes                # Interfaces with Windows API (Screen size, etc.)
 import csv                   # Parses command output data
 import io                    # Handles string streams for CSV parsing
+import json                  # Parses the batched PowerShell hardware scrape
 import math                  # Used for size calculations
+import functools             # Caches registry reads for the life of the process
 import winreg                # Access Windows Registry (Key for Motherboard info without Admin)
-from datetime import datetime # Used to format the System Uptime
+try:
+    import win32com.client   # COM bridge to WMI (pywin32) for in-process sensor queries
+    from pywintypes import com_error # Raised by failing WMI/COM calls
+except ImportError:
+    win32com = None
+    com_error = OSError
 
 # ==========================================
 # ⚙️ CONFIGURATION (USER SETTINGS)
@@ -50,6 +59,16 @@ WINDOW_X = 50
 WINDOW_Y = 50
 # How often to refresh data (1000ms = 1 second)
 REFRESH_RATE = 1000 
+# How often to refresh slow-moving data (Temperature, Partitions, Uptime, Health)
+SLOW_REFRESH_RATE = 5000
+# How many refresh ticks between re-reading slow-changing data (Partitions, Clock)
+RESCAN_TICKS = 30
+# How many misses in a row before the remembered temperature method is re-probed
+TEMP_PROBE_RETRIES = 3
+# Above this many logical cores, per-core bars are replaced by a single heatmap Canvas
+CORE_HEATMAP_THRESHOLD = 16
+CORE_HEATMAP_COLS = 32  # Heatmap cells per row
+CORE_CELL_SIZE = 12     # Heatmap cell size in pixels
 
 # --- COLOR PALETTE (Cyberpunk / Engineering Dark Theme) ---
 COLOR_BG = "#1a1a1a"          # Main window background (Deep Grey)
@@ -66,41 +85,65 @@ COLOR_INFO = "#5DA5DA"        # Light Blue for Hardware Model Names
 # 🔧 ADVANCED SCRAPING ENGINE
 # ==========================================
 
-def run_powershell(cmd):
+def run_powershell(cmd, timeout=3):
     """
     Executes a PowerShell command safely and returns the output string.
     Uses '-NoProfile' and '-ExecutionPolicy Bypass' to ensure it runs on strict systems.
+    Launched directly (no cmd.exe in between) and killed after 'timeout' seconds.
     """
     try:
-        full_cmd = f"powershell -NoProfile -ExecutionPolicy Bypass -Command \"{cmd}\""
-        # Hides the console window pop-up
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        
         result = subprocess.run(
-            full_cmd, 
+            ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", cmd],
             capture_output=True, 
             text=True, 
-            shell=True, 
-            startupinfo=startupinfo
+            errors="replace", # PowerShell writes the OEM codepage; don't crash on unmappable bytes
+            timeout=timeout,
+            creationflags=subprocess.CREATE_NO_WINDOW # Hides the console window pop-up
         )
         if result.returncode == 0:
             return result.stdout.strip()
-    except: pass
+    except (OSError, subprocess.SubprocessError): pass
     return None
 
+# One PowerShell launch for every one-shot hardware query (Disks, RAM, Monitor).
+# Each cmdlet is silenced individually so one missing class doesn't sink the rest.
+BOOT_SCRAPE_CMD = (
+    "@{"
+    "Disks = @(Get-PhysicalDisk -ErrorAction SilentlyContinue | Select-Object FriendlyName,Size); "
+    "Ram = @(Get-CimInstance Win32_PhysicalMemory -ErrorAction SilentlyContinue | Select-Object Manufacturer,PartNumber,Speed); "
+    "Monitor = @(Get-CimInstance WmiMonitorID -Namespace root\\wmi -ErrorAction SilentlyContinue | ForEach-Object {($_.UserFriendlyName -ne 0 | ForEach-Object {[char]$_}) -join ''})"
+    "} | ConvertTo-Json -Depth 4 -Compress"
+)
+
+def run_boot_scrape():
+    """
+    Runs BOOT_SCRAPE_CMD once and returns the parsed JSON document.
+    Returns an empty dict if PowerShell fails, so every getter falls back
+    to its own individual query.
+    """
+    # Several CIM queries in one cold PowerShell start, so allow more than the default
+    val = run_powershell(BOOT_SCRAPE_CMD, timeout=10)
+    if val:
+        try:
+            data = json.loads(val)
+            if isinstance(data, dict): return data
+        except ValueError: pass
+    return {}
+
+@functools.lru_cache(maxsize=None)
 def read_registry(path, key):
     """
     Reads a value directly from the Windows Registry.
     Why? Reading Registry 'HKLM' is often allowed for standard users,
     whereas WMI commands might throw 'Access Denied'.
+    Hardware keys never change during a session, so results are cached.
     """
     try:
-        # Open key with Read-Only permissions
-        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path, 0, winreg.KEY_READ) as reg_key:
+        # Open key with Read-Only permissions (64-bit view, even from 32-bit Python)
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY) as reg_key:
             value, _ = winreg.QueryValueEx(reg_key, key)
             return str(value)
-    except: pass
+    except OSError: pass # FileNotFoundError when the key/value doesn't exist
     return None
 
 # ==========================================
@@ -140,6 +183,11 @@ def get_motherboard_info():
 
     return "Generic Motherboard"
 
+# Size divisors, hoisted so format_marketing_size doesn't rebuild them per call
+_TIB_DIV = 1024**4
+_TB_DIV = 1000**4
+_GB_DIV = 1000**3
+
 def format_marketing_size(bytes_size):
     """
     Smart Storage Calculation.
@@ -152,141 +200,194 @@ def format_marketing_size(bytes_size):
     if bytes_size == 0: return "0B"
     
     # Binary Math (What Windows sees)
-    tib = bytes_size / (1024**4)
+    tib = bytes_size / _TIB_DIV
     # Decimal Math (What the Box says)
-    tb = bytes_size / (1000**4)
+    tb = bytes_size / _TB_DIV
     
     # If drive is 1 TB or larger, show dual format
     if tb > 0.9:
         marketing_str = f"{round(tb, 1)} TB"
     else:
         # Smaller drives (GB)
-        gb = bytes_size / (1000**3)
+        gb = bytes_size / _GB_DIV
         marketing_str = f"{round(gb, 0)} GB"
 
     return f"{tib:.2f} TiB ({marketing_str})"
 
-def get_disk_physical_info():
+def get_disk_physical_info(boot_scrape):
     """
     Uses PowerShell to identify PHYSICAL Disks (Hardware), not just partitions.
-    Parses CSV output for 100% reliability.
+    Reads the batched boot scrape, falling back to its own CSV query only
+    when the scrape itself failed (an empty section means "no disks found").
     """
     results = []
-    ps_cmd = "Get-PhysicalDisk | Select-Object -Property FriendlyName,Size | ConvertTo-Csv -NoTypeInformation"
-    val = run_powershell(ps_cmd)
     
-    if val:
-        lines = val.splitlines()
-        # Skip the first line (Header)
-        for line in lines[1:]:
-            try:
-                # CSV line format: "Samsung SSD...","500107862016"
-                parts = line.split(',')
-                if len(parts) >= 2:
-                    # Clean quotes
-                    name = parts[0].replace('"', '')
-                    size_str = parts[1].replace('"', '')
-                    
-                    # Convert size to dual format
-                    size_bytes = int(size_str)
-                    size_fmt = format_marketing_size(size_bytes)
-                    
-                    results.append(f"• {name} [{size_fmt}]")
-            except: pass
+    if "Disks" in boot_scrape:
+        rows = [(d.get("FriendlyName") or "", str(d.get("Size") or "")) for d in boot_scrape["Disks"] or []]
+    else:
+        rows = []
+        ps_cmd = "Get-PhysicalDisk | Select-Object -Property FriendlyName,Size | ConvertTo-Csv -NoTypeInformation"
+        val = run_powershell(ps_cmd)
+        if val:
+            # CSV line format: "Samsung SSD...","500107862016"
+            # csv.reader handles the quoting, including commas inside FriendlyName
+            reader = csv.reader(io.StringIO(val))
+            next(reader, None) # Skip the first line (Header)
+            rows = [row[:2] for row in reader if len(row) >= 2]
+    
+    for name, size_str in rows:
+        if not size_str.isdigit(): continue
+        # Convert size to dual format
+        size_fmt = format_marketing_size(int(size_str))
+        results.append(f"• {name} [{size_fmt}]")
             
     return results if results else ["Generic Storage"]
 
-def get_monitor_name():
+def get_partition_signature():
+    """
+    Returns ((device, mountpoint), ...) for every usable logical partition.
+    Partitions rarely change, so comparing this tuple is enough to know
+    whether the drive widgets need rebuilding.
+    """
+    return tuple((p.device, p.mountpoint) for p in psutil.disk_partitions()
+                 if 'cdrom' not in p.opts and p.fstype != '')
+
+def get_monitor_name(boot_scrape):
     """
     Decodes the EDID (Extended Display Identification Data) from WMI 
     to find the real Monitor Model Name (e.g. "Dell U2415").
     """
-    cmd = "Get-CimInstance WmiMonitorID -Namespace root\\wmi | ForEach-Object {($_.UserFriendlyName -ne 0 | ForEach-Object {[char]$_}) -join ''}"
-    val = run_powershell(cmd)
-    if val: return val.replace("\r", " + ").strip()
+    # Only re-query when the scrape itself failed; a blank EDID name (common on
+    # laptop panels) would just come back blank again.
+    if "Monitor" in boot_scrape:
+        monitors = [m for m in boot_scrape["Monitor"] or [] if m]
+        if monitors: return " + ".join(monitors).strip()
+    else:
+        cmd = "Get-CimInstance WmiMonitorID -Namespace root\\wmi | ForEach-Object {($_.UserFriendlyName -ne 0 | ForEach-Object {[char]$_}) -join ''}"
+        val = run_powershell(cmd)
+        if val: return val.replace("\r", " + ").strip()
     
-    # Fallback: Just show resolution
-    return f"Generic Display ({ctk.CTk().winfo_screenwidth()}x{ctk.CTk().winfo_screenheight()})"
+    # Fallback: Just show resolution (straight from Win32, no throwaway Tk window)
+    user32 = ctypes.windll.user32
+    return f"Generic Display ({user32.GetSystemMetrics(0)}x{user32.GetSystemMetrics(1)})"
 
-def get_cpu_temp():
+def connect_wmi(namespace):
     """
-    The "Aggressive" Temperature Probe.
-    Tries 4 different methods to find a valid temperature reading without asking for Admin.
+    Opens a persistent WMI connection (e.g. 'root\\wmi') through COM.
+    The handle is created once and reused, so every sensor poll is an in-process
+    query instead of a fresh powershell.exe launch.
     """
-    # Method 1: Standard Linux/Cross-platform sensors
-    try:
-        temps = psutil.sensors_temperatures()
-        if temps:
-            for name, entries in temps.items():
-                if 'cpu' in name.lower(): return entries[0].current
-    except: pass
-
-    # Method 2: WMI Performance Counters (Often accessible by Users)
-    # This reads the thermal zone info exposed to the OS performance monitor.
+    if win32com is None: return None
     try:
-        cmd = "(Get-WmiObject Win32_PerfFormattedData_Counters_ThermalZoneInformation).Temperature"
-        val = run_powershell(cmd)
-        if val:
-            # Usually returns Kelvin (e.g. 310 K)
-            t = int(val)
-            if t > 200: return t - 273.15
-            if t > 0: return t
-    except: pass
+        return win32com.client.GetObject(f"winmgmts:\\\\.\\{namespace}")
+    except com_error: pass
+    return None
 
-    # Method 3: WMI MSAcpi (Standard BIOS interface)
-    try:
-        cmd = "(Get-WmiObject MSAcpi_ThermalZoneTemperature -Namespace \"root/wmi\").CurrentTemperature"
-        val = run_powershell(cmd)
-        if val:
-            # Returns deci-Kelvin
-            return (int(val) / 10.0) - 273.15
-    except: pass
+# What a probe may raise on an unsupported machine: psutil has no sensors on
+# Windows (AttributeError), missing WMI classes (com_error), odd values (ValueError/TypeError)
+TEMP_PROBE_ERRORS = (ValueError, TypeError, OSError, AttributeError, com_error)
 
-    # Method 4: OpenHardwareMonitor Bridge
-    # If the user has OHM running in background, we can read its data via WMI.
-    try:
-        cmd = "Get-WmiObject -Namespace root\\OpenHardwareMonitor -Class Sensor | Where-Object { $_.SensorType -eq 'Temperature' -and $_.Name -like '*CPU*' } | Select-Object -ExpandProperty Value"
-        val = run_powershell(cmd)
-        if val:
-            return float(val)
-    except: pass
+def probe_temp_psutil():
+    """Method 1: Standard Linux/Cross-platform sensors."""
+    temps = psutil.sensors_temperatures()
+    if temps:
+        for name, entries in temps.items():
+            if 'cpu' in name.lower(): return entries[0].current
+    return None
 
+def probe_temp_perf_counters(wmi_cim):
+    """
+    Method 2: WMI Performance Counters (Often accessible by Users).
+    This reads the thermal zone info exposed to the OS performance monitor.
+    """
+    query = "SELECT Temperature FROM Win32_PerfFormattedData_Counters_ThermalZoneInformation"
+    for zone in wmi_cim.ExecQuery(query):
+        # Usually returns Kelvin (e.g. 310 K)
+        t = int(zone.Temperature)
+        if t > 200: return t - 273.15
+        if t > 0: return t
     return None
 
+def probe_temp_msacpi(wmi_wmi):
+    """Method 3: WMI MSAcpi (Standard BIOS interface)."""
+    for zone in wmi_wmi.ExecQuery("SELECT CurrentTemperature FROM MSAcpi_ThermalZoneTemperature"):
+        # Returns deci-Kelvin
+        return (int(zone.CurrentTemperature) / 10.0) - 273.15
+    return None
+
+def probe_temp_ohm(wmi_ohm):
+    """
+    Method 4: OpenHardwareMonitor Bridge.
+    If the user has OHM running in background, we can read its data via WMI.
+    """
+    query = "SELECT Value FROM Sensor WHERE SensorType = 'Temperature' AND Name LIKE '%CPU%'"
+    for sensor in wmi_ohm.ExecQuery(query):
+        return float(sensor.Value)
+    return None
+
+# --- NETWORK HELPERS ---
+
+def build_dns_query(query_id):
+    """
+    Builds a minimal DNS query for the root zone ('.', TYPE A, CLASS IN).
+    12-byte header (ID, Recursion Desired, 1 question) + 5-byte question.
+    """
+    header = struct.pack(">HHHHHH", query_id, 0x0100, 1, 0, 0, 0)
+    return header + b"\x00" + struct.pack(">HH", 1, 1)
+
 # --- FORMATTING HELPERS ---
 
-def get_ram_details():
+def get_ram_details(boot_scrape):
     """
     Fetches RAM Stick details (Brand, Speed) using PowerShell CIM instances.
+    Reads the batched boot scrape, falling back to its own CSV query only
+    when the scrape itself failed.
     """
-    try:
+    if "Ram" in boot_scrape:
+        rows = [[str(m.get(k) or "") for k in ("Manufacturer", "PartNumber", "Speed")] for m in boot_scrape["Ram"] or []]
+    else:
+        rows = []
         cmd = "Get-CimInstance Win32_PhysicalMemory | Select-Object Manufacturer,PartNumber,Speed | ConvertTo-Csv -NoTypeInformation"
         val = run_powershell(cmd)
         if val:
-            lines = val.splitlines()
-            if len(lines) > 1:
-                p = lines[1].split(',')
-                if len(p) >= 3:
-                    man = p[0].replace('"','').strip()
-                    part = p[1].replace('"','').strip()
-                    spd = p[2].replace('"','').strip()
-                    # Return Part Number if Manufacturer is generic code
-                    if "0000" in man or len(man) < 2: return f"{part} @ {spd} MHz"
-                    return f"{man} {part} @ {spd} MHz"
-    except: pass
+            reader = csv.reader(io.StringIO(val))
+            next(reader, None) # Skip the first line (Header)
+            rows = list(reader)
+
+    # Only the first stick is reported
+    for row in rows:
+        if len(row) < 3: continue
+        man, part, spd = (field.strip() for field in row[:3])
+        # Return Part Number if Manufacturer is generic code
+        if "0000" in man or len(man) < 2: return f"{part} @ {spd} MHz"
+        return f"{man} {part} @ {spd} MHz"
     return "Standard Memory"
 
+# Unit prefixes and their binary shifts (1 KB = 1 << 10 bytes)
+_UNITS = ("", "K", "M", "G", "T", "P")
+_SHIFTS = (0, 10, 20, 30, 40, 50)
+
 def get_size(bytes, suffix="B"):
-    """Formats bytes to KB, MB, GB for general usage."""
-    factor = 1024
-    for unit in ["", "K", "M", "G", "T", "P"]:
-        if bytes < factor: return f"{bytes:.2f}{unit}{suffix}"
-        bytes /= factor
+    """
+    Formats bytes to KB, MB, GB for general usage.
+    The unit is picked in one step from the bit length instead of dividing in a loop.
+    """
+    idx = min(max(0, (int(bytes).bit_length() - 1) // 10), 5)
+    val = bytes / (1 << _SHIFTS[idx])
+    return f"{val:.2f}{_UNITS[idx]}{suffix}"
+
+# NOTE: These helpers are tiny, scalar and called a few dozen times per second.
+# The app's time goes to I/O, subprocesses and Tk redraws, not arithmetic, so a
+# JIT (e.g. Numba) has nothing to speed up here and would only add a heavy
+# dependency and start-up compile time. Keep them as plain, table-driven Python.
+
+# Load thresholds (upper bound, color), checked in order; anything above is critical
+_BUCKETS = ((50, COLOR_GOOD), (80, COLOR_WARN))
 
 def get_color_by_usage(percent):
     """Returns color hex code based on load intensity."""
-    if percent < 50: return COLOR_GOOD
-    if percent < 80: return COLOR_WARN
+    for limit, color in _BUCKETS:
+        if percent < limit: return color
     return COLOR_CRIT
 
 # ==========================================
@@ -304,18 +405,34 @@ class SystemMonitorApp(ctk.CTk):
         ctk.set_default_color_theme("blue")
 
         # --- Hardware Analysis (Run Once) ---
+        self._boot_scrape = run_boot_scrape() # Single PowerShell launch for Disks/RAM/Monitor
         self.hw_cpu_model = get_cpu_brand()
         self.hw_motherboard = get_motherboard_info() 
-        self.hw_disk_physical = get_disk_physical_info() 
-        self.hw_monitor_name = get_monitor_name()
-        self.hw_ram_model = get_ram_details()
+        self.hw_disk_physical = get_disk_physical_info(self._boot_scrape) 
+        self.hw_monitor_name = get_monitor_name(self._boot_scrape)
+        self.hw_ram_model = get_ram_details(self._boot_scrape)
+
+        # --- Temperature Probes (Connect Once, Reuse Every Tick) ---
+        self._wmi_wmi = connect_wmi(r"root\wmi")
+        self._wmi_cim = connect_wmi(r"root\CIMV2")
+        self._wmi_ohm = connect_wmi(r"root\OpenHardwareMonitor")
+        self._temp_probes = [probe_temp_psutil]
+        if self._wmi_cim: self._temp_probes.append(lambda: probe_temp_perf_counters(self._wmi_cim))
+        if self._wmi_wmi: self._temp_probes.append(lambda: probe_temp_msacpi(self._wmi_wmi))
+        if self._wmi_ohm: self._temp_probes.append(lambda: probe_temp_ohm(self._wmi_ohm))
+        self._temp_method = None # The probe that worked on this machine
+        self._temp_failures = 0  # Consecutive misses of self._temp_method
         
         # Performance Score: A fun metric based on cores and RAM
         self.perf_rating = min(100, (psutil.cpu_count() * 5) + (psutil.virtual_memory().total // (1024**3)))
         
         # Tracking Variables
-        self.old_net_io = psutil.net_io_counters()
         self.ping_latency = 0 
+        self._boot_ts = psutil.boot_time()
+        self._last_values = {}  # Last text shown per label, for change detection
+        self._snapshot = {}     # Latest psutil readings, published by the sampler thread
+        self._lock = threading.Lock()
+        self._bar_colors = {}   # Last progress_color per bar, for change detection
         
         # --- UI Layout Setup ---
         self.grid_columnconfigure(0, weight=1)
@@ -338,8 +455,10 @@ class SystemMonitorApp(ctk.CTk):
         self.create_network_section()
 
         # --- Start Loops ---
-        self.start_ping_thread() # Background Network Check
-        self.update_ui_loop()    # Main GUI Update Timer
+        self.start_ping_thread()    # Background Network Check
+        self.start_sampler_thread() # Background psutil Sampling
+        self.update_fast()       # Main GUI Update Timer (CPU, RAM, Network)
+        self.update_slow()       # Slow GUI Update Timer (Temperature, Disks, Health)
 
     # ---------------------------------------------------------
     # UI CONSTRUCTION METHODS
@@ -386,19 +505,44 @@ class SystemMonitorApp(ctk.CTk):
         self.lbl_cpu_freq.pack(anchor="w", padx=15)
 
         # Core Grid
-        ctk.CTkLabel(self.cpu_frame, text=f"Logical Cores ({psutil.cpu_count()})", font=("Arial", 12, "bold")).pack(pady=(15, 5))
+        core_count = psutil.cpu_count()
+        ctk.CTkLabel(self.cpu_frame, text=f"Logical Cores ({core_count})", font=("Arial", 12, "bold")).pack(pady=(15, 5))
         self.cores_frame = ctk.CTkFrame(self.cpu_frame, fg_color="transparent")
         self.cores_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
         self.core_widgets = []
-        for i in range(min(psutil.cpu_count(), 32)):
-            f = ctk.CTkFrame(self.cores_frame, fg_color="transparent")
-            f.grid(row=i//4, column=i%4, padx=5, pady=2, sticky="ew")
-            lbl = ctk.CTkLabel(f, text=f"Core {i+1}", font=("Consolas", 10), width=60, anchor="w")
-            lbl.pack(side="left")
-            bar = ctk.CTkProgressBar(f, height=6, width=50)
-            bar.pack(side="left", padx=5)
-            self.core_widgets.append((lbl, bar))
+        self.core_rects = []
+        if core_count > CORE_HEATMAP_THRESHOLD:
+            # Many-core CPUs: one Canvas with a colored cell per core (O(1) widgets)
+            cols = min(core_count, CORE_HEATMAP_COLS)
+            rows = math.ceil(core_count / cols)
+            # A plain Canvas draws in raw pixels, so apply CustomTkinter's DPI scaling ourselves
+            cell = round(CORE_CELL_SIZE * ctk.ScalingTracker.get_widget_scaling(self))
+            self.core_canvas = ctk.CTkCanvas(self.cores_frame, width=cols * cell, height=rows * cell,
+                                             bg=COLOR_FRAME, highlightthickness=0)
+            self.core_canvas.pack(pady=5)
+            for i in range(core_count):
+                x, y = (i % cols) * cell, (i // cols) * cell
+                rect = self.core_canvas.create_rectangle(x + 1, y + 1, x + cell - 1, y + cell - 1,
+                                                         fill=COLOR_BG, width=0)
+                self.core_rects.append(rect)
+            return
+        
+        # Label + Bar per core, gridded straight onto cores_frame (4 cores per row).
+        # Fixed-width columns (label 60px + 5px pad, bar 50px + 15px pad) keep Tk
+        # from re-solving the layout on resize. minsize is raw pixels, so apply DPI scaling.
+        scale = ctk.ScalingTracker.get_widget_scaling(self)
+        for col in range(8):
+            width = (60 + 5) if col % 2 == 0 else (50 + 15)
+            self.cores_frame.grid_columnconfigure(col, weight=0, minsize=round(width * scale))
+        
+        for i in range(core_count):
+            row, col = i // 4, (i % 4) * 2
+            lbl = ctk.CTkLabel(self.cores_frame, text=f"Core {i+1}", font=("Consolas", 10), width=60, anchor="w")
+            lbl.grid(row=row, column=col, padx=(5, 0), pady=2, sticky="w")
+            bar = ctk.CTkProgressBar(self.cores_frame, height=6, width=50)
+            bar.grid(row=row, column=col + 1, padx=(5, 10), pady=2)
+            self.core_widgets.append({"lbl": lbl, "bar": bar})
 
     def create_memory_section(self):
         self.mem_frame = ctk.CTkFrame(self.scroll_frame, corner_radius=10, fg_color=COLOR_FRAME)
@@ -440,6 +584,27 @@ class SystemMonitorApp(ctk.CTk):
         self.drives_container = ctk.CTkFrame(self.disk_frame, fg_color="transparent")
         self.drives_container.pack(fill="both", expand=True, padx=10, pady=5)
         self.drive_widgets = {} 
+        self.build_drive_widgets(get_partition_signature())
+
+    def build_drive_widgets(self, parts_sig):
+        """(Re)builds one row per partition. Only runs when the partition set changes."""
+        for w in self.drive_widgets.values(): w["frame"].destroy()
+        self.drive_widgets = {}
+        
+        for drive_name, _ in parts_sig:
+            f = ctk.CTkFrame(self.drives_container, fg_color="transparent")
+            f.pack(fill="x", pady=5)
+            lbl_name = ctk.CTkLabel(f, text=drive_name, width=50, anchor="w", font=("Arial", 12, "bold"))
+            lbl_name.pack(side="left")
+            bar = ctk.CTkProgressBar(f)
+            bar.pack(side="left", fill="x", expand=True, padx=10)
+            lbl_det = ctk.CTkLabel(f, text="", font=("Consolas", 11), width=220, anchor="e")
+            lbl_det.pack(side="right")
+            self.drive_widgets[drive_name] = {"frame": f, "lbl": lbl_det, "bar": bar}
+            # Fresh widgets, so forget the text/color cached for the old ones
+            self._last_values.pop(f"drive_{drive_name}", None)
+            self._bar_colors.pop(f"drive_{drive_name}", None)
+        self._parts_sig = parts_sig
 
     def create_network_section(self):
         self.net_frame = ctk.CTkFrame(self.scroll_frame, corner_radius=10, fg_color=COLOR_FRAME)
@@ -472,107 +637,214 @@ class SystemMonitorApp(ctk.CTk):
     # ---------------------------------------------------------
 
     def get_system_uptime(self):
-        boot = datetime.fromtimestamp(psutil.boot_time())
-        return str(datetime.now() - boot).split('.')[0]
+        # Boot time is constant, so format straight from integer seconds
+        s = int(time.time() - self._boot_ts)
+        h, s = divmod(s, 3600)
+        m, s = divmod(s, 60)
+        return f"{h}:{m:02d}:{s:02d}"
+
+    def get_cpu_temp(self):
+        """
+        The "Aggressive" Temperature Probe.
+        Tries each available method once; the first one that returns a reading
+        is remembered and becomes the only one polled from then on.
+        After TEMP_PROBE_RETRIES misses in a row the full probe runs again
+        (e.g. a sensor tool like OHM was started later).
+        """
+        if self._temp_method:
+            try: temp = self._temp_method()
+            except TEMP_PROBE_ERRORS: temp = None
+            if temp:
+                self._temp_failures = 0
+                return temp
+            
+            self._temp_failures += 1
+            if self._temp_failures < TEMP_PROBE_RETRIES: return None
+            # Winner stopped answering: forget it and walk every method again
+            self._temp_method = None
+            self._temp_failures = 0
+
+        for probe in self._temp_probes:
+            try:
+                temp = probe()
+                if temp:
+                    self._temp_method = probe
+                    return temp
+            except TEMP_PROBE_ERRORS: pass
+        return None
 
     def start_ping_thread(self):
         def check_ping_logic():
+            # One UDP socket for the life of the thread: a single DNS query/answer
+            # per sample, no TCP handshake and no TIME_WAIT churn.
+            s = None
             while True:
                 try:
-                    st = time.time()
-                    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    s.settimeout(1.0)
-                    s.connect(("8.8.8.8", 53))
-                    s.close()
-                    self.ping_latency = (time.time() - st) * 1000
-                except: self.ping_latency = -1
+                    if s is None:
+                        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                        s.settimeout(1.0)
+                    query = build_dns_query(random.getrandbits(16))
+                    st = time.monotonic()
+                    s.sendto(query, ("8.8.8.8", 53))
+                    while True:
+                        data, _ = s.recvfrom(512)
+                        # Ignore late answers to earlier (timed-out) queries
+                        if data[:2] == query[:2]: break
+                    self.ping_latency = (time.monotonic() - st) * 1000
+                except OSError: self.ping_latency = -1 # Includes socket timeouts
                 time.sleep(1)
         thread = threading.Thread(target=check_ping_logic, daemon=True)
         thread.start()
 
+    def start_sampler_thread(self):
+        """
+        Collects every psutil reading off the Tk thread and publishes them as one
+        snapshot dict. The update loops only copy the snapshot and render it.
+        """
+        disk_ticks = max(1, SLOW_REFRESH_RATE // REFRESH_RATE)
+        
+        def sample_logic():
+            tick = 0
+            old_net_io = psutil.net_io_counters()
+            while True:
+                # Throttled Re-Scans (Partitions & Clock change slowly)
+                if tick % RESCAN_TICKS == 0:
+                    parts_sig = get_partition_signature()
+                    cpu_freq = psutil.cpu_freq()
+                
+                # Partition usage is only shown by the slow loop
+                if tick % disk_ticks == 0:
+                    disks = {}
+                    for device, mountpoint in parts_sig:
+                        try: disks[device] = psutil.disk_usage(mountpoint)
+                        except OSError: continue # e.g. PermissionError, drive not ready
+                
+                # One per-core sample feeds both the core grid and the aggregate load
+                cores = psutil.cpu_percent(percpu=True)
+                new_net_io = psutil.net_io_counters()
+                new_snapshot = {
+                    "cores": cores,
+                    "cpu_pct": round(sum(cores) / len(cores), 1),
+                    "cpu_freq": cpu_freq,
+                    "mem": psutil.virtual_memory(),
+                    "swap": psutil.swap_memory(),
+                    "net_down": new_net_io.bytes_recv - old_net_io.bytes_recv,
+                    "net_up": new_net_io.bytes_sent - old_net_io.bytes_sent,
+                    "parts_sig": parts_sig,
+                    "disks": disks,
+                }
+                old_net_io = new_net_io
+                with self._lock: self._snapshot = new_snapshot
+                
+                tick += 1
+                time.sleep(REFRESH_RATE / 1000)
+        thread = threading.Thread(target=sample_logic, daemon=True)
+        thread.start()
+
     def calculate_health(self, cpu, ram):
         load = 100 - ((cpu + ram) / 2)
         if self.ping_latency == -1: load -= 20
         return max(0, min(100, int(load)))
 
-    def update_ui_loop(self):
+    def set_text(self, widget, key, new_text, **kwargs):
+        """
+        Change-detecting configure(). CustomTkinter redraws its Canvas on every
+        configure() call, so skip it when the label already shows this text.
+        Extra options (e.g. text_color) are derived from the same value as the text.
+        """
+        if self._last_values.get(key) == new_text: return
+        self._last_values[key] = new_text
+        widget.configure(text=new_text, **kwargs)
+
+    def set_bar(self, bar, key, percent):
+        """
+        Sets a progress bar's level, recoloring it only when the load bucket
+        (good/warn/crit) changes, so steady loads cost one set() per tick.
+        """
+        new_color = get_color_by_usage(percent)
+        if self._bar_colors.get(key) != new_color:
+            self._bar_colors[key] = new_color
+            bar.configure(progress_color=new_color)
+        bar.set(percent / 100)
+
+    def update_fast(self):
+        """Fast-moving data (CPU, Memory, Network, Ping), refreshed every REFRESH_RATE."""
+        with self._lock: snap = self._snapshot.copy()
+        if not snap:
+            # Sampler hasn't published yet
+            self.after(REFRESH_RATE, self.update_fast)
+            return
+
         # 1. CPU Updates
-        cpu_pct = psutil.cpu_percent()
-        cpu_free = 100 - cpu_pct
-        self.lbl_cpu_val.configure(text=f"Used: {cpu_pct}% | Free: {100-cpu_pct:.1f}%")
-        self.lbl_cpu_freq.configure(text=f"Clock: {psutil.cpu_freq().current:.0f} MHz")
-        self.prog_cpu.set(cpu_pct / 100)
-        self.prog_cpu.configure(progress_color=get_color_by_usage(cpu_pct))
-        
-        # Temp Update (Aggressive Check)
-        temp = get_cpu_temp()
-        if temp:
-            self.lbl_cpu_temp.configure(text=f"Temperature: {temp:.1f}°C")
-        else:
-            self.lbl_cpu_temp.configure(text=f"Temperature: N/A (Sensor Locked)")
+        cpu_pct = snap["cpu_pct"]
+        self.set_text(self.lbl_cpu_val, "cpu", f"Used: {cpu_pct}% | Free: {100-cpu_pct:.1f}%")
+        if snap["cpu_freq"]:
+            self.set_text(self.lbl_cpu_freq, "cpu_freq", f"Clock: {snap['cpu_freq'].current:.0f} MHz")
+        self.set_bar(self.prog_cpu, "cpu", cpu_pct)
 
         # Core Updates
-        cores = psutil.cpu_percent(percpu=True)
-        for i, usage in enumerate(cores):
-            if i < len(self.core_widgets):
-                lbl, bar = self.core_widgets[i]
-                lbl.configure(text=f"Core {i+1}: {usage:.0f}%") 
-                bar.set(usage / 100)
-                bar.configure(progress_color=get_color_by_usage(usage))
+        if self.core_rects:
+            # Heatmap: recolor only the cells whose load bucket changed
+            for i, usage in enumerate(snap["cores"][:len(self.core_rects)]):
+                new_color = get_color_by_usage(usage)
+                if self._bar_colors.get(f"core_{i}") != new_color:
+                    self._bar_colors[f"core_{i}"] = new_color
+                    self.core_canvas.itemconfig(self.core_rects[i], fill=new_color)
+        else:
+            for i, (w, usage) in enumerate(zip(self.core_widgets, snap["cores"])):
+                self.set_text(w["lbl"], f"core_{i}", f"Core {i+1}: {usage:.0f}%")
+                self.set_bar(w["bar"], f"core_{i}", usage)
 
         # 2. Memory Updates
-        mem = psutil.virtual_memory()
-        swap = psutil.swap_memory()
-        self.lbl_ram_text.configure(text=f"RAM: Total: {get_size(mem.total)} | Used: {get_size(mem.used)} ({mem.percent}%)")
-        self.prog_ram.set(mem.percent / 100)
-        self.prog_ram.configure(progress_color=get_color_by_usage(mem.percent))
-        self.lbl_swap_text.configure(text=f"SWAP: Total: {get_size(swap.total)} | Used: {get_size(swap.used)} ({swap.percent}%)")
-        self.prog_swap.set(swap.percent / 100)
-        self.prog_swap.configure(progress_color=get_color_by_usage(swap.percent))
-
-        # 3. Storage Updates (Partitions)
-        partitions = psutil.disk_partitions()
-        for p in partitions:
-            try:
-                if 'cdrom' in p.opts or p.fstype == '': continue
-                usage = psutil.disk_usage(p.mountpoint)
-                drive_name = p.device
-                
-                if drive_name not in self.drive_widgets:
-                    f = ctk.CTkFrame(self.drives_container, fg_color="transparent")
-                    f.pack(fill="x", pady=5)
-                    lbl_name = ctk.CTkLabel(f, text=drive_name, width=50, anchor="w", font=("Arial", 12, "bold"))
-                    lbl_name.pack(side="left")
-                    bar = ctk.CTkProgressBar(f)
-                    bar.pack(side="left", fill="x", expand=True, padx=10)
-                    lbl_det = ctk.CTkLabel(f, text="", font=("Consolas", 11), width=220, anchor="e")
-                    lbl_det.pack(side="right")
-                    self.drive_widgets[drive_name] = (bar, lbl_det)
-                
-                bar, lbl_det = self.drive_widgets[drive_name]
-                bar.set(usage.percent / 100)
-                bar.configure(progress_color=get_color_by_usage(usage.percent))
-                lbl_det.configure(text=f"{usage.percent}% ({get_size(usage.used)} / {get_size(usage.total)})")
-            except: continue
-
-        # 4. Network Updates
-        new_net = psutil.net_io_counters()
-        ds = new_net.bytes_recv - self.old_net_io.bytes_recv
-        us = new_net.bytes_sent - self.old_net_io.bytes_sent
-        self.old_net_io = new_net
-        self.lbl_down_val.configure(text=f"{get_size(ds)}/s")
-        self.lbl_up_val.configure(text=f"{get_size(us)}/s")
+        mem, swap = snap["mem"], snap["swap"]
+        self.set_text(self.lbl_ram_text, "ram", f"RAM: Total: {get_size(mem.total)} | Used: {get_size(mem.used)} ({mem.percent}%)")
+        self.set_bar(self.prog_ram, "ram", mem.percent)
+        self.set_text(self.lbl_swap_text, "swap", f"SWAP: Total: {get_size(swap.total)} | Used: {get_size(swap.used)} ({swap.percent}%)")
+        self.set_bar(self.prog_swap, "swap", swap.percent)
+
+        # 3. Network Updates
+        self.set_text(self.lbl_down_val, "net_down", f"{get_size(snap['net_down'])}/s")
+        self.set_text(self.lbl_up_val, "net_up", f"{get_size(snap['net_up'])}/s")
 
         if self.ping_latency == -1:
-            self.lbl_ping.configure(text="Ping: Offline ❌", text_color=COLOR_CRIT)
+            self.set_text(self.lbl_ping, "ping", "Ping: Offline ❌", text_color=COLOR_CRIT)
         else:
             p_color = COLOR_GOOD if self.ping_latency < 100 else COLOR_WARN
-            self.lbl_ping.configure(text=f"Ping (Google): {self.ping_latency:.0f} ms", text_color=p_color)
+            self.set_text(self.lbl_ping, "ping", f"Ping (Google): {self.ping_latency:.0f} ms", text_color=p_color)
+
+        self.after(REFRESH_RATE, self.update_fast)
+
+    def update_slow(self):
+        """Slow-moving data (Temperature, Partitions, Uptime, Health), refreshed every SLOW_REFRESH_RATE."""
+        # Temp Update (Aggressive Check)
+        # Stays on the Tk thread: the WMI COM handles belong to the thread that created them.
+        temp = self.get_cpu_temp()
+        if temp:
+            self.set_text(self.lbl_cpu_temp, "temp", f"Temperature: {temp:.1f}°C")
+        else:
+            self.set_text(self.lbl_cpu_temp, "temp", "Temperature: N/A (Sensor Locked)")
+
+        with self._lock: snap = self._snapshot.copy()
+        if not snap:
+            self.after(SLOW_REFRESH_RATE, self.update_slow)
+            return
+
+        # Storage Updates (Partitions)
+        # Rows are only rebuilt when a drive is added/removed (e.g. USB plug events)
+        if snap["parts_sig"] != self._parts_sig:
+            self.build_drive_widgets(snap["parts_sig"])
+        
+        for drive_name, w in self.drive_widgets.items():
+            usage = snap["disks"].get(drive_name)
+            if usage is None: continue
+            self.set_bar(w["bar"], f"drive_{drive_name}", usage.percent)
+            self.set_text(w["lbl"], f"drive_{drive_name}", f"{usage.percent}% ({get_size(usage.used)} / {get_size(usage.total)})")
 
-        self.lbl_health.configure(text=f"System Health: {self.calculate_health(cpu_pct, mem.percent)}%", text_color=COLOR_GOOD)
-        self.lbl_uptime.configure(text=f"Uptime: {self.get_system_uptime()}")
+        health = self.calculate_health(snap["cpu_pct"], snap["mem"].percent)
+        self.set_text(self.lbl_health, "health", f"System Health: {health}%", text_color=COLOR_GOOD)
+        self.set_text(self.lbl_uptime, "uptime", f"Uptime: {self.get_system_uptime()}")
 
-        self.after(REFRESH_RATE, self.update_ui_loop)
+        self.after(SLOW_REFRESH_RATE, self.update_slow)
 
 if __name__ == "__main__":
     app = SystemMonitorApp()